@@ -1,3 +1,11 @@
+import sys
+from pathlib import Path
+import matplotlib
+
+# --save renders headlessly to docs/ instead of opening a window
+SAVE = "--save" in sys.argv
+if SAVE:
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 
@@ -40,5 +48,9 @@ for arrow in arrows:
     ax.add_patch(arrow)
 
 # Show the flowchart
-plt.show()
+if SAVE:
+    Path("docs").mkdir(exist_ok=True)
+    fig.savefig("docs/flowchart.png", dpi=100)
+else:
+    plt.show()
 
@@ -7,7 +7,8 @@ from src.analysis.results_analyzer import DTNResultsAnalyzer
 from datetime import datetime
 
 def main():
-    # Initialize simulator and analyzer
+    # Initialize simulator and analyzer once; the analyzer is shared by every
+    # simulation below so its cached topology and figures are reused
     simulator = SimpleNetworkSimulator()
     analyzer = DTNResultsAnalyzer()
     
@@ -1,3 +1,11 @@
+import sys
+from pathlib import Path
+import matplotlib
+
+# --save renders headlessly to docs/ instead of opening a window
+SAVE = "--save" in sys.argv
+if SAVE:
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
 
@@ -39,4 +47,8 @@ for pos, label, color in zip(positions, labels, colors):
     ax.text(pos[0], pos[1], label, ha="center", va="center", fontsize=10, weight="bold")
 
 # Display the circular diagram
-plt.show()
+if SAVE:
+    Path("docs").mkdir(exist_ok=True)
+    fig.savefig("docs/architecture.png", dpi=100)
+else:
+    plt.show()
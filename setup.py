@@ -7,8 +7,6 @@ setup(
     install_requires=[
         'networkx',
         'matplotlib',
-        'numpy',
-        'seaborn',
-        'pandas'
+        'numpy'
     ]
 )
@@ -1,19 +1,22 @@
+import sys
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import deque
 from typing import Optional
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; fall back to a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Bundle:
     source: str
     destination: str
     payload: str
-    creation_timestamp: datetime = None
+    creation_timestamp: datetime = field(default_factory=datetime.now)
     id: Optional[str] = None
     priority: int = 1
     
     def __post_init__(self):
-        if self.creation_timestamp is None:
-            self.creation_timestamp = datetime.now()
         if self.id is None:
             self.id = f"bundle_{self.creation_timestamp.strftime('%H%M%S')}"
             
@@ -27,7 +30,7 @@ class Bundle:
 class DTNNode:
     def __init__(self, node_id: str):
         self.id = node_id
-        self.buffer = []
+        self.buffer = deque()
         self.max_buffer_size = 1024 * 1024  # 1MB default
         
     def store_bundle(self, bundle: Bundle) -> bool:
@@ -40,5 +43,5 @@ class DTNNode:
     def forward_bundle(self) -> Optional[Bundle]:
         """Forward next bundle from buffer"""
         if self.buffer:
-            return self.buffer.pop(0)
+            return self.buffer.popleft()
         return None
\ No newline at end of file
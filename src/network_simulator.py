@@ -1,43 +1,77 @@
 from datetime import datetime
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import logging
+import multiprocessing
 import time
-import json
 from src.dtn_core import DTNNode, Bundle
 from src.visualization import DTNVisualizer
 from src.base import NetworkSimulatorBase
 import numpy as np
 from src.utils.config import ConfigLoader
-import random
 from src.utils.logger import DTNLogger
-import networkx as nx
+from src.utils.topology import TOPOLOGY_PATH, read_network_graph, read_topology
 from src.routing_algorithms import DTNRoutingAlgorithm
 
+def _norm_link(a, b):
+    """Return an orientation-independent key for the undirected link a-b."""
+    return (a, b) if a < b else (b, a)
+
+def _simulate_headless(run_index, message, source, destination, seed, error_rate, disruption_rate):
+    """Run one independent headless simulation; the worker for simulate_batch.
+    
+    The bundle id comes from the run index, so it does not depend on which
+    worker process picks the run up.
+    """
+    simulator = SimpleNetworkSimulator(headless=True, seed=seed)
+    simulator.error_rate = error_rate
+    simulator.disruption_rate = disruption_rate
+    simulator.setup_mars_earth_network()
+    return simulator.simulate_transmission(message, source, destination,
+                                           bundle_id=f"bundle_{run_index:08d}")
+
 class SimpleNetworkSimulator(NetworkSimulatorBase):
-    def __init__(self):
+    _bundle_seq = itertools.count()  # default ids; unique only within one process
+    
+    def __init__(self, headless: bool = False, seed=None):
+        """Create a simulator; headless ones skip the live plot and pacing sleeps."""
         self.nodes = {}
         self.config = ConfigLoader()
+        network_params = self.config.get_simulation_params()["network"]
+        self.error_rate = network_params["error_rate"]
+        self.disruption_rate = network_params["disruption_rate"]
         self.logger = DTNLogger()
-        self.visualizer = DTNVisualizer(self.config)
+        self.visualizer = None if headless else DTNVisualizer(self.config)
+        self.realtime = not headless  # pace the run for live visualization
+        self.frame_interval = 1 / 30  # min seconds between redraws when not paced
+        self._pending_frame = None
+        self._last_frame = float("-inf")
+        self._sim_clock = 0.0  # virtual seconds spent waiting in the current run
+        self._rng = np.random.default_rng(seed)
+        self._draw = self._random_draws().__next__  # shared pool across runs
         self.topology = self.load_topology()
-        self.buffer = {}
+        self.buffer = defaultdict(Counter)  # per-node stored copies, keyed by bundle id
+        self._buffer_sizes = Counter()  # per-node total copies
+        self._buf_max = 0  # peak copies held at any one node
         self.network_graph = self._build_network_graph()
-        self.router = DTNRoutingAlgorithm(self._build_network_graph())
+        self.router = DTNRoutingAlgorithm(self.network_graph)  # router only reads the graph
         
     def _build_network_graph(self):
-        """Build a NetworkX graph from topology for path finding."""
-        G = nx.Graph()
-        for link in self.topology["links"]:
-            G.add_edge(link["source"], link["target"], 
-                      delay=link["delay"],
-                      distance=link["distance"])
+        """Get the shared NetworkX graph of the topology for path finding."""
+        G = read_network_graph(TOPOLOGY_PATH)
+        # Flat (u, v) -> delay lookup for the transmission loop, both directions
+        self._edge_delay = {}
+        for u, v, delay in G.edges(data="delay"):
+            self._edge_delay[(u, v)] = self._edge_delay[(v, u)] = delay
         return G
         
     def load_topology(self):
         """Load network topology from JSON file."""
         try:
-            with open('data/network_topologies/mars_earth.json', 'r') as f:
-                topology = json.load(f)
-                print("Network topology loaded successfully")
-                return topology
+            topology = read_topology(TOPOLOGY_PATH)
+            print("Network topology loaded successfully")
+            return topology
         except FileNotFoundError:
             print("Error: Topology file not found!")
             return None
@@ -60,25 +94,58 @@ class SimpleNetworkSimulator(NetworkSimulatorBase):
                       for link in self.topology['links']]
         
         # Setup visualization
-        node_ids = [node['id'] for node in self.topology['nodes']]
-        self.visualizer.create_network_graph(node_ids, connections)
+        if self.visualizer is not None:
+            node_ids = [node['id'] for node in self.topology['nodes']]
+            self.visualizer.create_network_graph(node_ids, connections)
         
         return True
         
+    def _queue_frame(self, **state):
+        """Queue a visualizer update; unpaced runs redraw at most once per frame_interval."""
+        if self.visualizer is None:
+            return
+        self._pending_frame = state
+        if self.realtime or time.monotonic() - self._last_frame >= self.frame_interval:
+            self._flush_frame()
+            
+    def _flush_frame(self):
+        """Draw the most recent queued visualizer update, if any."""
+        if self._pending_frame is not None:
+            self.visualizer.update_simulation_state(**self._pending_frame)
+            self._pending_frame = None
+            self._last_frame = time.monotonic()
+            
+    def _advance_sim_time(self, seconds):
+        """Advance the virtual clock, sleeping for real only when paced."""
+        self._sim_clock += seconds
+        if self.realtime:
+            time.sleep(seconds)
+            
+    def _random_draws(self, batch_size=4096):
+        """Yield uniform [0, 1) floats, sampled from the RNG in batches."""
+        while True:
+            yield from self._rng.random(batch_size).tolist()
+            
     def simulate_transmission(self, message: str, source: str = "mars_rover_1", 
-                            destination: str = "earth_station_1"):
-        """Run automated simulation with retry mechanism and store-and-forward."""
-        bundle_id = f"bundle_{datetime.now().strftime('%H%M%S')}"
+                            destination: str = "earth_station_1", bundle_id: str = None):
+        """Run automated simulation with retry mechanism and store-and-forward.
+        
+        bundle_id defaults to the next id from the per-process sequence; pass
+        one explicitly when ids must be unique across processes.
+        """
+        if bundle_id is None:
+            bundle_id = f"bundle_{next(self._bundle_seq):08d}"
         bundle = Bundle(
             id=bundle_id,
             source=source,
             destination=destination,
-            payload=message,
-            creation_timestamp=datetime.now()
+            payload=message
         )
         
         # Initialize simulation state
+        self._sim_clock = 0.0
         disrupted_links = set()
+        disrupted_norm = set()  # same links, keyed by _norm_link
         total_delay = 0
         retransmissions = 0
         successful_delivery = False
@@ -88,9 +155,19 @@ class SimpleNetworkSimulator(NetworkSimulatorBase):
         # Get initial path options from router
         path_options = self.router.get_alternative_paths(current_node, destination)
         current_path = path_options[0][0] if path_options else []
+        current_idx = 0  # position of current_node in current_path
+        path_edges = list(zip(current_path, current_path[1:]))  # hop tuples, built once per path
         initial_paths_count = len(path_options)
         paths_attempted = 0
         max_retries_per_link = 3
+        reroutes = 0  # disruptions handled by rerouting or link recovery
+        max_reroutes = 100  # bounds reroute ping-pong on unlucky draws
+        
+        # Network parameters are fixed for the whole run
+        error_rate = self.error_rate
+        disruption_rate = self.disruption_rate
+        recovery_threshold = (error_rate + disruption_rate) / 2
+        draw = self._draw
         
         # Add path history tracking
         path_history = []
@@ -107,7 +184,7 @@ class SimpleNetworkSimulator(NetworkSimulatorBase):
             })
             
             # Update visualization
-            self.visualizer.update_simulation_state(
+            self._queue_frame(
                 current_path=current_path,
                 current_node=current_node,
                 disrupted_links=disrupted_links,
@@ -116,49 +193,61 @@ class SimpleNetworkSimulator(NetworkSimulatorBase):
                     "total_delay": total_delay,
                     "retransmissions": retransmissions,
                     "status": "In Transit",
-                    "available_paths": len(path_options)
+                    "available_paths": len(path_options),
+                    "path_index": current_idx
                 }
             )
             
             # Get next node in current path
-            current_idx = current_path.index(current_node)
             if current_idx == len(current_path) - 1:
                 successful_delivery = True
                 completed_path.append(current_node)
                 path_history[-1]["status"] = "Completed"
                 break
             
-            next_node = current_path[current_idx + 1]
+            edge = path_edges[current_idx]
+            next_node = edge[1]
             
             # Check for disruption or error
-            is_error = random.random() < self.config.get_simulation_params()["network"]["error_rate"]
-            is_disrupted = random.random() < self.config.get_simulation_params()["network"]["disruption_rate"]
+            is_error = draw() < error_rate
+            is_disrupted = draw() < disruption_rate
             
             if is_error or is_disrupted:
+                if reroutes == max_reroutes:
+                    print(f"Giving up after {max_reroutes} reroutes")
+                    self.logger.log_network_event("ReroutesExhausted", f"Giving up after {max_reroutes} reroutes")
+                    path_history[-1]["status"] = "Failed - Max reroutes reached"
+                    break
+                reroutes += 1
+                
                 print(f"Link disrupted: {current_node} -> {next_node}")
                 self.logger.log_network_event("LinkDisrupted", f"Link disrupted: {current_node} -> {next_node}")
-                disrupted_links.add((current_node, next_node))
+                disrupted_links.add(edge)
+                disrupted_norm.add(_norm_link(current_node, next_node))
                 path_history[-1]["status"] = f"Failed at {current_node}->{next_node}"
                 
                 # Store bundle at current node
-                if current_node not in self.buffer:
-                    self.buffer[current_node] = []
-                self.buffer[current_node].append(bundle)
+                self.buffer[current_node][bundle_id] += 1
+                self._buffer_sizes[current_node] += 1
+                if self._buffer_sizes[current_node] > self._buf_max:
+                    self._buf_max = self._buffer_sizes[current_node]
                 stored_bundles_count += 1
                 
                 # Recalculate path from current node
                 path_options = self.router.get_alternative_paths(current_node, destination)
                 
-                # Filter out paths that start with disrupted links
+                # Filter out paths that start with disrupted links, in either direction
                 path_options = [
                     (path, delay) for path, delay in path_options
-                    if not (path[0], path[1]) in disrupted_links
+                    if _norm_link(path[0], path[1]) not in disrupted_norm
                 ]
                 
                 if path_options:
                     print(f"Found new path from {current_node}: {path_options[0][0]}")
                     self.logger.log_network_event("NewPath", f"Found new path from {current_node}: {path_options[0][0]}")
                     current_path = path_options[0][0]
+                    current_idx = 0
+                    path_edges = list(zip(current_path, current_path[1:]))
                     path_history.append({
                         "attempt": paths_attempted + 1,
                         "path": current_path,
@@ -172,21 +261,24 @@ class SimpleNetworkSimulator(NetworkSimulatorBase):
                     retry_count = 0
                     while retry_count < max_retries_per_link:
                         print(f"Retry attempt {retry_count + 1}/{max_retries_per_link}")
-                        self.logger.log_network_event("RetryAttempt", f"Retry attempt {retry_count + 1}/{max_retries_per_link}")
-                        time.sleep(1)  # Wait before retry
+                        self.logger.log_network_event("RetryAttempt", f"Retry attempt {retry_count + 1}/{max_retries_per_link}",
+                                                      level=logging.DEBUG)
+                        self._advance_sim_time(1)  # Wait before retry
                         
                         # Check if link recovers
-                        if random.random() > (self.config.get_simulation_params()["network"]["error_rate"] + 
-                                            self.config.get_simulation_params()["network"]["disruption_rate"]) / 2:
+                        if draw() > recovery_threshold:
                             print(f"Link recovered: {current_node} -> {next_node}")
                             self.logger.log_network_event("LinkRecovered", f"Link recovered: {current_node} -> {next_node}")
-                            disrupted_links.remove((current_node, next_node))
+                            disrupted_links.remove(edge)
+                            disrupted_norm.discard(_norm_link(current_node, next_node))
                             retransmissions += 1
                             
                             # Recalculate path options after recovery
                             path_options = self.router.get_alternative_paths(current_node, destination)
                             if path_options:
                                 current_path = path_options[0][0]
+                                current_idx = 0
+                                path_edges = list(zip(current_path, current_path[1:]))
                                 print(f"Found new path after recovery: {current_path}")
                                 self.logger.log_network_event("NewPathAfterRecovery", f"Found new path after recovery: {current_path}")
                                 path_history.append({
@@ -207,43 +299,72 @@ class SimpleNetworkSimulator(NetworkSimulatorBase):
                     continue
             
             # Successful transmission
-            total_delay += self.network_graph[current_node][next_node]["delay"]
+            total_delay += self._edge_delay[edge]
             completed_path.append(current_node)
             current_node = next_node
+            current_idx += 1
             
             # Remove from buffer if it was stored
-            if current_node in self.buffer and bundle in self.buffer[current_node]:
-                self.buffer[current_node].remove(bundle)
+            stored = self.buffer.get(current_node)
+            if stored and stored[bundle_id]:
+                stored[bundle_id] -= 1
+                self._buffer_sizes[current_node] -= 1
             
-            time.sleep(0.5)  # Visualization delay
+            self._advance_sim_time(0.5)  # Visualization delay
+        
+        self._flush_frame()  # make sure the last state is on screen
         
         final_status = "Delivered" if successful_delivery else "Failed"
         print(f"Simulation completed: {final_status}")
         self.logger.log_network_event("SimulationComplete", f"Simulation completed: {final_status}")
         
-        # Calculate max stored bundles
-        max_stored_bundles = max([len(bundles) for bundles in self.buffer.values()]) if self.buffer else 0
-        
         return {
             "total_delay": total_delay,
             "total_retransmissions": retransmissions,
             "disruptions": len(disrupted_links),
             "stored_bundles": stored_bundles_count,
-            "max_stored_bundles": max_stored_bundles,
+            "max_stored_bundles": self._buf_max,
             "total_storage_events": stored_bundles_count,
             "status": final_status,
             "final_path": completed_path,
             "path_history": path_history,
             "total_available_paths": initial_paths_count,
             "paths_attempted": paths_attempted,
+            "simulated_wait_time": self._sim_clock,
             "bundle_id": bundle_id,
             "source": source,
             "destination": destination,
             "message": message,
             "simulation_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "disrupted_links": list(disrupted_links),
-            "buffer_states": {k: len(v) for k, v in self.buffer.items()},
+            "buffer_states": dict(self._buffer_sizes),
             "successful_delivery": successful_delivery,
             "recovery_attempts": retransmissions,
             "successful_recoveries": len([link for link in disrupted_links if link not in self.buffer])
-        }
\ No newline at end of file
+        }
+        
+    def simulate_batch(self, message: str, n_runs: int, source: str = "mars_rover_1",
+                       destination: str = "earth_station_1", n_jobs=None, seed=None):
+        """Run n_runs independent headless simulations across worker processes.
+        
+        Every run gets a fresh simulator seeded from its own SeedSequence child,
+        and run i carries bundle id ``bundle_<i>``, so a batch is reproducible
+        for a given seed whatever n_jobs is. Runs use this simulator's
+        error_rate and disruption_rate. Stats are returned in run order.
+        
+        Workers are spawned rather than forked: the logger runs a writer
+        thread, and forking a process with a live thread can deadlock. As with
+        any spawned pool, scripts calling this need an ``if __name__ == "__main__"``
+        guard.
+        """
+        seeds = np.random.SeedSequence(seed).spawn(n_runs)
+        with ProcessPoolExecutor(max_workers=n_jobs,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            return list(pool.map(_simulate_headless,
+                                 range(n_runs),
+                                 itertools.repeat(message, n_runs),
+                                 itertools.repeat(source, n_runs),
+                                 itertools.repeat(destination, n_runs),
+                                 seeds,
+                                 itertools.repeat(self.error_rate, n_runs),
+                                 itertools.repeat(self.disruption_rate, n_runs)))
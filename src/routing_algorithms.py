@@ -1,71 +1,124 @@
 from typing import Dict, List, Tuple, Set
+import functools
+import logging
 import networkx as nx
-from collections import defaultdict
+from operator import itemgetter
+from collections import defaultdict, deque
+from src.utils.topology import DEEP_SPACE_KM, parse_distance_km
+
+logger = logging.getLogger("DTNSimulation.routing")
+
+MAX_NODE_BUFFER = 1024  # entries kept per node; older ones are evicted
 
 class DTNRoutingAlgorithm:
     def __init__(self, network_graph: nx.Graph):
-        self.network_graph = network_graph
+        self.network_graph = network_graph  # shared, so the router only reads it
+        # Plain-dict adjacency (sharing the edge data dicts) for lookups outside networkx
+        self._adj = {u: dict(nbrs) for u, nbrs in network_graph.adjacency()}
+        # Per-edge search weights keyed by (u, v) in both directions, computed
+        # once rather than per relaxation and kept out of the graph itself
+        self._combined_weight = {}
+        self._reliability = {}
+        for u, v, data in network_graph.edges(data=True):
+            # Graphs not built by read_network_graph may only carry the distance string
+            distance_km = data.get('distance_km')
+            if distance_km is None:
+                distance_km = parse_distance_km(data['distance'])
+            is_deep_space = data.get('is_deep_space')
+            if is_deep_space is None:
+                is_deep_space = distance_km > DEEP_SPACE_KM
+            self._combined_weight[u, v] = self._combined_weight[v, u] = \
+                data['delay'] * (1 + distance_km)
+            # Deep space links are less reliable
+            self._reliability[u, v] = self._reliability[v, u] = \
+                0.7 if is_deep_space else 0.9
         self.disrupted_links = set()
-        self.node_buffers = defaultdict(list)
+        self.node_buffers = defaultdict(functools.partial(deque, maxlen=MAX_NODE_BUFFER))
+        # (source, destination, max_paths) -> ranked paths, bound per instance so
+        # entries never outlive the graph they were computed on
+        self._path_cache = functools.lru_cache(maxsize=128)(self._rank_alternative_paths)
+        # (source, destination, frozenset(disruptions)) -> (path, delay)
+        self._best_path_cache = functools.lru_cache(maxsize=10_000)(self._search_best_path)
         
     def find_best_path(self, source: str, destination: str, 
                       current_disruptions: Set[tuple]) -> Tuple[List[str], float]:
-        """Find best path considering current network conditions."""
-        # Create a copy of network graph for path calculation
-        working_graph = self.network_graph.copy()
+        """Find best path considering current network conditions.
         
-        # Remove disrupted links from consideration
-        for src, dst in current_disruptions:
-            if working_graph.has_edge(src, dst):
-                working_graph.remove_edge(src, dst)
-                
+        Results are cached per (source, destination, disruptions), keeping
+        the most recently used entries.
+        """
+        path, total_delay = self._best_path_cache(source, destination, frozenset(current_disruptions))
+        return list(path), total_delay
+        
+    def _search_best_path(self, source: str, destination: str,
+                          disrupted: frozenset) -> Tuple[Tuple[str, ...], float]:
+        """Search the shared graph for the best path, skipping disrupted links."""
+        combined = self._combined_weight
+        
+        def weight(u, v, d):
+            # Disrupted links are skipped in either direction (None hides the edge)
+            if (u, v) in disrupted or (v, u) in disrupted:
+                return None
+            return combined[u, v]
+            
         try:
             # Find path with lowest combined delay and distance
-            path = nx.shortest_path(working_graph, source, destination, 
-                                  weight=lambda u, v, d: d['delay'] * (1 + float(d['distance'].replace('M km', '000000').replace(' km', ''))))
-            total_delay = sum(working_graph[path[i]][path[i+1]]['delay'] 
-                            for i in range(len(path)-1))
-            return path, total_delay
+            path = nx.shortest_path(self.network_graph, source, destination, weight=weight)
+            total_delay = sum(self._adj[u][v]['delay'] for u, v in zip(path, path[1:]))
         except nx.NetworkXNoPath:
-            return [], float('inf')
+            return (), float('inf')
+        return tuple(path), total_delay
             
     def get_alternative_paths(self, source: str, destination: str, max_paths: int = 3) -> List[Tuple[List[str], float]]:
-        """Get multiple alternative paths sorted by estimated reliability."""
+        """Get multiple alternative paths sorted by estimated reliability.
+        
+        The ranking depends only on the network graph, which is treated as
+        static, so results are cached per (source, destination, max_paths).
+        Call ``self._path_cache.cache_clear()`` after changing the graph.
+        """
+        return [(list(p), d) for p, d in self._path_cache(source, destination, max_paths)]
+        
+    def _rank_alternative_paths(self, source: str, destination: str, max_paths: int) -> Tuple[Tuple[Tuple[str, ...], float], ...]:
+        """Rank simple paths by delay and reliability, stopping once the best are known.
+        
+        Paths are drawn lazily in order of increasing delay. A path's score
+        (delay / reliability) is never below its delay, so once max_paths
+        candidates are held and the next path's delay reaches the worst
+        retained score, no remaining path can displace it.
+        """
         paths = []
+        examined = 0
+        adj = self._adj
+        reliability_of = self._reliability
         try:
-            # Get all simple paths between source and destination
-            all_paths = list(nx.all_simple_paths(self.network_graph, source, destination))
-            
-            for path in all_paths:
+            for path in nx.shortest_simple_paths(self.network_graph, source, destination, weight="delay"):
                 # Calculate total delay for this path
-                total_delay = sum(self.network_graph[path[i]][path[i+1]]['delay'] 
-                                for i in range(len(path)-1))
+                total_delay = sum(adj[u][v]['delay'] for u, v in zip(path, path[1:]))
+                if len(paths) == max_paths and total_delay >= paths[-1][0]:
+                    break
+                examined += 1
                 
                 # Calculate path reliability based on distance
                 reliability = 1.0
-                for i in range(len(path)-1):
-                    distance = self.network_graph[path[i]][path[i+1]]['distance']
-                    if 'M km' in distance:  # Deep space links are less reliable
-                        reliability *= 0.7
-                    else:
-                        reliability *= 0.9
-                        
-                paths.append((path, total_delay, reliability))
-            
-            # Sort by combination of delay and reliability
-            paths.sort(key=lambda x: x[1] * (1/x[2]))
+                for u, v in zip(path, path[1:]):
+                    reliability *= reliability_of[u, v]
+                    
+                # Keep the best max_paths by combination of delay and reliability
+                paths.append((total_delay * (1/reliability), path, total_delay, reliability))
+                paths.sort(key=itemgetter(0))
+                del paths[max_paths:]
             
-            # Print for debugging
-            print(f"Found {len(paths)} possible paths")
-            for p, d, r in paths[:max_paths]:
-                print(f"Path: {p}")
-                print(f"Delay: {d}, Reliability: {r:.2f}")
+            logger.info("Ranked %d paths %s -> %s (examined %d)",
+                        len(paths), source, destination, examined)
+            if logger.isEnabledFor(logging.DEBUG):
+                for _, p, d, r in paths:
+                    logger.debug("Path: %s, Delay: %s, Reliability: %.2f", p, d, r)
                 
-            return [(p[0], p[1]) for p in paths[:max_paths]]
+            return tuple((tuple(p), d) for _, p, d, _ in paths)
             
         except nx.NetworkXNoPath:
-            print(f"No path found between {source} and {destination}")
-            return []
+            logger.warning("No path found between %s and %s", source, destination)
+            return ()
         except Exception as e:
-            print(f"Error finding paths: {str(e)}")
-            return []
+            logger.warning("Error finding paths: %s", e)
+            return ()
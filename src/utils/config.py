@@ -1,16 +1,23 @@
 import yaml
 from pathlib import Path
+from src.utils.frozen import freeze
+
+# Resolved settings path -> parsed, read-only configuration
+_CONFIG_CACHE = {}
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 class ConfigLoader:
     def __init__(self):
         self.config = self.load_config()
     
     def load_config(self):
-        """Load configuration from settings.yaml"""
+        """Load configuration from settings.yaml (parsed once per process)"""
         try:
-            config_path = Path("config/settings.yaml")
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f)
+            config_path = Path("config/settings.yaml").resolve()
+            if config_path not in _CONFIG_CACHE:
+                with open(config_path, "r") as f:
+                    _CONFIG_CACHE[config_path] = freeze(yaml.load(f, Loader=_YAML_LOADER))
+            return _CONFIG_CACHE[config_path]
         except FileNotFoundError:
             print("Error: settings.yaml not found!")
             return None
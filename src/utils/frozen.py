@@ -0,0 +1,13 @@
+from types import MappingProxyType
+
+def freeze(value):
+    """Return a read-only deep copy of nested dicts and lists.
+
+    Dicts become MappingProxyType views and lists become tuples, so values
+    shared through a cache cannot be mutated by one of their consumers.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
@@ -1,9 +1,16 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from pathlib import Path
 
 class DTNLogger:
     def __init__(self):
+        self.logger = logging.getLogger('DTNSimulation')
+        if self.logger.handlers:
+            return  # already configured by an earlier DTNLogger in this process
+        
         # Create logs directory if it doesn't exist
         Path("logs").mkdir(exist_ok=True)
         
@@ -21,26 +28,36 @@ class DTNLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Set up logger
-        self.logger = logging.getLogger('DTNSimulation')
+        # Set up logger; records are only enqueued here and written by a listener thread
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                                  respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
         self.logger.setLevel(logging.INFO)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self.logger.addHandler(queue_handler)
         
     def log_bundle_event(self, event_type: str, bundle_id: str, 
                         current_node: str, next_node: str = None, 
                         status: str = None, details: dict = None):
         """Log bundle-related events with detailed information."""
-        msg = f"Bundle {bundle_id} - {event_type} at {current_node}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        msg, args = "Bundle %s - %s at %s", [bundle_id, event_type, current_node]
         if next_node:
-            msg += f" -> {next_node}"
+            msg += " -> %s"
+            args.append(next_node)
         if status:
-            msg += f" ({status})"
+            msg += " (%s)"
+            args.append(status)
         if details:
-            msg += f"\nDetails: {details}"
+            msg += "\nDetails: %s"
+            args.append(details)
         
-        self.logger.info(msg)
+        self.logger.info(msg, *args)
         
-    def log_network_event(self, event_type: str, details: dict):
-        """Log network-related events."""
-        self.logger.info(f"Network Event - {event_type}: {details}")
+    def log_network_event(self, event_type: str, details: dict, level: int = logging.INFO):
+        """Log network-related events; formatting is skipped below the logger's level."""
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, "Network Event - %s: %s", event_type, details)
@@ -0,0 +1,58 @@
+import functools
+import json
+import os
+import re
+import networkx as nx
+from src.utils.frozen import freeze
+
+TOPOLOGY_PATH = "data/network_topologies/mars_earth.json"
+DEEP_SPACE_KM = 1e5  # links longer than this are interplanetary
+
+_DIST_RE = re.compile(r"([\d.]+)\s*(M\s*)?km")
+
+def parse_distance_km(distance):
+    """Convert a topology distance string such as "200M km" or "400 km" to km."""
+    match = _DIST_RE.match(distance)
+    value = float(match.group(1))
+    return value * 1000000 if match.group(2) else value
+
+@functools.lru_cache(maxsize=4)
+def _read_topology_cached(path, mtime):
+    """Parse a topology file once per (path, mtime) and share the result."""
+    with open(path, "r") as f:
+        topology = json.load(f)
+    for link in topology["links"]:
+        # Older topology files only carry the human-readable distance string
+        if "distance_km" not in link:
+            link["distance_km"] = parse_distance_km(link["distance"])
+        link["is_deep_space"] = link["distance_km"] > DEEP_SPACE_KM
+    return freeze(topology)
+
+def read_topology(path=TOPOLOGY_PATH):
+    """Load a network topology, reusing the parsed copy while the file is unchanged.
+
+    The returned structure is read-only because it is shared by every caller.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    return _read_topology_cached(path, os.path.getmtime(path))
+
+@functools.lru_cache(maxsize=4)
+def _network_graph_cached(path, mtime):
+    """Build the link graph once per (path, mtime) and share it."""
+    topology = _read_topology_cached(path, mtime)
+    G = nx.Graph()
+    G.add_nodes_from(node["id"] for node in topology["nodes"])
+    G.add_edges_from((link["source"], link["target"],
+                      {"delay": link["delay"], "distance": link["distance"],
+                       "distance_km": link["distance_km"],
+                       "is_deep_space": link["is_deep_space"]})
+                     for link in topology["links"])
+    return nx.freeze(G)
+
+def read_network_graph(path=TOPOLOGY_PATH):
+    """Return the topology links as a NetworkX graph, reused while the file is unchanged.
+
+    The graph is frozen because it is shared by every caller; use G.copy()
+    for a mutable version. Raises FileNotFoundError if the file does not exist.
+    """
+    return _network_graph_cached(path, os.path.getmtime(path))
@@ -0,0 +1,4 @@
+import os
+
+# Render with the non-interactive backend so tests never probe for a display
+os.environ.setdefault("MPLBACKEND", "Agg")
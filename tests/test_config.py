@@ -0,0 +1,9 @@
+import pytest
+from src.utils.config import ConfigLoader
+
+def test_config_is_parsed_once_and_read_only():
+    first, second = ConfigLoader(), ConfigLoader()
+    assert first.config is second.config
+    assert first.get_simulation_params()["network"]["error_rate"] == 0.15
+    with pytest.raises(TypeError):
+        first.get_visualization_params()["node_size"] = 1
@@ -0,0 +1,39 @@
+from src.network_simulator import SimpleNetworkSimulator
+
+OUTCOME_KEYS = ("bundle_id", "status", "total_delay", "total_retransmissions", "disruptions", "final_path")
+
+def test_headless_simulator_skips_visualization():
+    simulator = SimpleNetworkSimulator(headless=True, seed=1)
+    assert simulator.visualizer is None
+    assert not simulator.realtime
+    assert simulator.setup_mars_earth_network()
+    stats = simulator.simulate_transmission("Test message")
+    assert stats["status"] in ("Delivered", "Failed")
+    assert stats["simulated_wait_time"] >= 0.5 * (len(stats["final_path"]) - 1)
+
+def test_simulate_batch_is_reproducible_for_a_seed():
+    simulator = SimpleNetworkSimulator(headless=True)
+    first = simulator.simulate_batch("Test message", n_runs=4, n_jobs=2, seed=7)
+    second = simulator.simulate_batch("Test message", n_runs=4, n_jobs=3, seed=7)
+    assert [s["bundle_id"] for s in first] == [f"bundle_{i:08d}" for i in range(4)]
+    assert [[s[k] for k in OUTCOME_KEYS] for s in first] == \
+           [[s[k] for k in OUTCOME_KEYS] for s in second]
+
+def test_simulate_batch_uses_the_simulator_rates():
+    simulator = SimpleNetworkSimulator(headless=True)
+    simulator.error_rate = simulator.disruption_rate = 0
+    stats = simulator.simulate_batch("Test message", n_runs=2, n_jobs=2, seed=3)
+    assert all(s["status"] == "Delivered" and s["disruptions"] == 0 for s in stats)
+
+def test_long_routes_are_not_capped_by_hop_count(monkeypatch):
+    import networkx as nx
+    from src import network_simulator
+    line = nx.path_graph([f"n{i}" for i in range(150)])
+    for edge in line.edges:
+        line.edges[edge].update(delay=1, distance="1 km", distance_km=1.0, is_deep_space=False)
+    monkeypatch.setattr(network_simulator, "read_network_graph", lambda path: line)
+    simulator = SimpleNetworkSimulator(headless=True, seed=1)
+    simulator.error_rate = simulator.disruption_rate = 0
+    stats = simulator.simulate_transmission("Test message", "n0", "n149")
+    assert stats["status"] == "Delivered"
+    assert stats["total_delay"] == 149
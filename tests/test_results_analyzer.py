@@ -0,0 +1,32 @@
+import json
+from datetime import datetime
+import numpy as np
+from src.analysis.results_analyzer import DTNResultsAnalyzer
+
+def test_total_distance_near_space():
+    analyzer = DTNResultsAnalyzer()
+    path = ["mars_rover_1", "mars_base", "mars_orbiter_1"]
+    assert analyzer._calculate_total_distance(path) == "500.0 km"
+
+def test_total_distance_deep_space():
+    analyzer = DTNResultsAnalyzer()
+    path = ["mars_base", "mars_orbiter_1", "deep_space_relay_1"]
+    assert analyzer._calculate_total_distance(path) == "200.0M km"
+
+def test_total_distance_is_direction_independent():
+    analyzer = DTNResultsAnalyzer()
+    path = ["earth_station_1", "earth_relay_1", "deep_space_relay_1"]
+    assert (analyzer._calculate_total_distance(path) ==
+            analyzer._calculate_total_distance(list(reversed(path))))
+
+def test_stats_json_is_the_same_with_and_without_orjson(tmp_path, monkeypatch):
+    from src.analysis import results_analyzer
+    stats = {"total_delay": np.int64(5), "rate": np.float64(0.5), "path": ["a", "b"],
+             "started": datetime(2024, 1, 2, 3, 4, 5)}
+    results_analyzer._write_stats(stats, tmp_path / "native.json")
+    monkeypatch.setattr(results_analyzer, "orjson", None)
+    results_analyzer._write_stats(stats, tmp_path / "stdlib.json")
+    native = (tmp_path / "native.json").read_text()
+    assert native == (tmp_path / "stdlib.json").read_text()
+    assert json.loads(native)["total_delay"] == 5
+    assert json.loads(native)["started"] == "2024-01-02 03:04:05"
@@ -0,0 +1,62 @@
+import networkx as nx
+from src.routing_algorithms import DTNRoutingAlgorithm
+
+def _diamond_graph():
+    near = {"distance": "400 km", "distance_km": 400.0, "is_deep_space": False}
+    far = {"distance": "200M km", "distance_km": 2e8, "is_deep_space": True}
+    G = nx.Graph()
+    G.add_edge("a", "b", delay=10, **near)
+    G.add_edge("b", "d", delay=10, **near)
+    G.add_edge("a", "c", delay=5, **far)
+    G.add_edge("c", "d", delay=5, **far)
+    return G
+
+def test_alternative_paths_ranked_by_delay_and_reliability():
+    router = DTNRoutingAlgorithm(_diamond_graph())
+    paths = router.get_alternative_paths("a", "d")
+    assert paths == [(["a", "c", "d"], 10), (["a", "b", "d"], 20)]
+
+def test_alternative_paths_are_cached():
+    router = DTNRoutingAlgorithm(_diamond_graph())
+    first = router.get_alternative_paths("a", "d")
+    first.clear()
+    assert router.get_alternative_paths("a", "d") == [(["a", "c", "d"], 10), (["a", "b", "d"], 20)]
+    first = router.get_alternative_paths("a", "d")
+    first[0][0].append("x")
+    assert router.get_alternative_paths("a", "d")[0] == (["a", "c", "d"], 10)
+    assert router._path_cache.cache_info().currsize == 1
+
+def test_reliability_can_outrank_lower_delay():
+    G = _diamond_graph()
+    G["a"]["b"]["delay"] = G["b"]["d"]["delay"] = 7
+    router = DTNRoutingAlgorithm(G)
+    assert router.get_alternative_paths("a", "d", max_paths=1) == [(["a", "b", "d"], 14)]
+
+def test_find_best_path_avoids_disruptions():
+    router = DTNRoutingAlgorithm(_diamond_graph())
+    assert router.find_best_path("a", "d", set()) == (["a", "b", "d"], 20)
+    assert router.find_best_path("a", "d", {("a", "b")}) == (["a", "c", "d"], 10)
+    assert router.find_best_path("a", "d", {("d", "c"), ("b", "a")}) == ([], float('inf'))
+
+def test_find_best_path_is_cached_per_disruption_set():
+    router = DTNRoutingAlgorithm(_diamond_graph())
+    router.find_best_path("a", "d", {("a", "b")})[0].append("x")
+    assert router.find_best_path("a", "d", {("a", "b")}) == (["a", "c", "d"], 10)
+    assert router.find_best_path("a", "d", set()) == (["a", "b", "d"], 20)
+    assert router._best_path_cache.cache_info().currsize == 2
+
+def test_router_does_not_write_into_the_graph():
+    G = _diamond_graph()
+    before = {edge: dict(data) for edge, data in G.edges.items()}
+    DTNRoutingAlgorithm(G).find_best_path("a", "d", set())
+    assert {edge: dict(data) for edge, data in G.edges.items()} == before
+
+def test_router_accepts_graphs_with_only_distance_strings():
+    G = nx.Graph()
+    G.add_edge("a", "b", delay=10, distance="400 km")
+    G.add_edge("b", "d", delay=10, distance="400 km")
+    G.add_edge("a", "c", delay=5, distance="200M km")
+    G.add_edge("c", "d", delay=5, distance="200M km")
+    router = DTNRoutingAlgorithm(G)
+    assert router.get_alternative_paths("a", "d") == [(["a", "c", "d"], 10), (["a", "b", "d"], 20)]
+    assert router.find_best_path("a", "d", set()) == (["a", "b", "d"], 20)
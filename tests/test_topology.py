@@ -0,0 +1,21 @@
+import pytest
+import networkx as nx
+from src.utils.topology import parse_distance_km, read_network_graph, read_topology
+
+def test_parse_distance_km():
+    assert parse_distance_km("400 km") == 400
+    assert parse_distance_km("200M km") == 200000000
+
+def test_read_topology_is_cached_and_read_only():
+    topology = read_topology()
+    assert read_topology() is topology
+    link = topology["links"][0]
+    assert link["distance_km"] == parse_distance_km(link["distance"])
+    with pytest.raises(TypeError):
+        link["delay"] = 0
+
+def test_read_network_graph_is_shared_and_frozen():
+    G = read_network_graph()
+    assert read_network_graph() is G
+    assert nx.is_frozen(G)
+    assert G.number_of_edges() == len(read_topology()["links"])